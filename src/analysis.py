@@ -24,20 +24,35 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Tuple, Dict
 
+import numpy as np
 import pandas as pd
 
 
+# Integer codes (-1 = missing) and labels of a column, categorising it first if needed.
+def _codes_and_categories(s: pd.Series) -> Tuple[np.ndarray, pd.Index]:
+    if not isinstance(s.dtype, pd.CategoricalDtype):
+        s = s.astype("category")
+    return s.cat.codes.to_numpy(), s.cat.categories
+
 # Returns the continent with the largest number of countries and its count.
 def most_countries_by_continent(df: pd.DataFrame) -> Tuple[str, int]:
-    vc = df["continent"].value_counts(dropna=False)
-    continent = vc[vc == vc.max()].index[0]
-    return str(continent), int(vc.max())
+    codes, cats = _codes_and_categories(df["continent"])
+    codes = codes[codes >= 0]
+    counts = np.bincount(codes, minlength=len(cats))
+    # On a tie, keep the continent that appears first in the data (as value_counts() did),
+    # not the alphabetically first category.
+    tied = counts == counts.max()
+    i = codes[tied[codes]][0]
+    return str(cats[i]), int(counts[i])
 
 # Returns the region with the largest combined area in sq. km.
 def region_with_largest_area(df: pd.DataFrame) -> Tuple[str, float]:
-    group = df.groupby("region_un", dropna=False)["area_km2"].sum(numeric_only=True)
-    region = group.idxmax()
-    return str(region), float(group.loc[region])
+    codes, cats = _codes_and_categories(df["region_un"])
+    area = df["area_km2"].to_numpy(dtype=np.float64)
+    valid = (codes >= 0) & ~np.isnan(area)
+    sums = np.bincount(codes[valid], weights=area[valid], minlength=len(cats))
+    i = sums.argmax()
+    return str(cats[i]), float(sums[i])
 
 # Returns the country has the highest life expectancy.
 def country_highest_life_expectancy(df: pd.DataFrame) -> Tuple[str, float]:
@@ -47,11 +62,10 @@ def country_highest_life_expectancy(df: pd.DataFrame) -> Tuple[str, float]:
 
 # Returns subregion has the lowest / highest average GDP per capita.
 def subregion_gdp_extremes(df: pd.DataFrame) -> Tuple[str, float, str, float]:
-    means = df.groupby("subregion", dropna=False)["gdpPercap"].mean(numeric_only=True)
+    means = df.groupby("subregion", dropna=False, observed=True)["gdpPercap"].mean()
     means = means[means.index.notna()]
-    sub_min = means.idxmin()
-    sub_max = means.idxmax()
-    return str(sub_min), float(means.loc[sub_min]), str(sub_max), float(means.loc[sub_max])
+    ext = means.agg(["idxmin", "min", "idxmax", "max"])
+    return str(ext["idxmin"]), float(ext["min"]), str(ext["idxmax"]), float(ext["max"])
 
 # Write a readable summary file.
 def write_summary_txt(out_path: str | Path, answers: Dict[str, object]) -> None:
@@ -3,7 +3,7 @@ cleaning.py
 Data cleaning pipeline for worldData.csv
 
 This module provides:
-    clean_world_data(df_raw) -> (df_clean, report: dict) 
+    clean_world_data(df_raw, generate_report=True, include_stats=False) -> (df_clean, report: dict) 
         Cleans and prepares the raw dataset: converts types, removes invalid values, imputes missing data, deduplicates by iso_a2, and adds population density.
     
     save_cleaning_report(report, path)
@@ -18,11 +18,20 @@ from typing import Dict, List, Tuple
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
 
 NUMERIC_COLS = ["area_km2", "pop", "lifeExp", "gdpPercap"]
 IDENTIFIER_COLS = ["iso_a2", "name_long"]
 GROUP_COLS = ["continent", "subregion"]
+CATEGORY_COLS = ["continent", "region_un", "subregion", "type"]
+
+# Plain decimal / scientific notation and (case-insensitive) inf / infinity are accepted
+# after cleanup, matching pd.to_numeric; anything else becomes NaN.
+NUMBER_PATTERN = r"(?i)^[+-]?((\d+\.?\d*|\.\d+)(e[+-]?\d+)?|inf|infinity)$"
+# Whole numbers that always fit in int64.
+INTEGER_PATTERN = r"^[+-]?\d{1,18}$"
 
 
 # --- Helpers ---
@@ -30,63 +39,57 @@ GROUP_COLS = ["continent", "subregion"]
 def _to_numeric_safe(s: pd.Series) -> pd.Series:
     if s.dtype.kind in "biufc":
         return s
-    
-    cleaned = (
-        s.astype(str)
-        .str.replace("\u00a0", " ", regex=False)
-        .str.replace(",", "", regex=False)
-        .str.strip()
-    )
-    cleaned = cleaned.replace({"": np.nan, "nan": np.nan, "Nan": np.nan})
-    return pd.to_numeric(cleaned, errors="coerce")
+
+    # One pass of Arrow string kernels instead of a chain of pandas .str Series
+    arr = pa.array(s.astype(str).to_numpy(), type=pa.string())
+    arr = pc.utf8_trim_whitespace(pc.replace_substring(pc.replace_substring(arr, "\u00a0", " "), ",", ""))
+    arr = pc.if_else(pc.match_substring_regex(arr, NUMBER_PATTERN), arr, pa.scalar(None, pa.string()))
+    # Like pd.to_numeric, stay integer when every value is a whole number.
+    if arr.null_count == 0 and pc.all(pc.match_substring_regex(arr, INTEGER_PATTERN), min_count=0).as_py():
+        # Arrow's integer parser rejects an explicit '+' sign
+        arr, target = pc.replace_substring_regex(arr, r"^\+", ""), pa.int64()
+    else:
+        target = pa.float64()
+    values = pc.cast(arr, target).to_numpy(zero_copy_only=False)
+    return pd.Series(values, index=s.index, name=s.name)
 
 
 # Group-wise median imputation with fallbacks.
 def _imputation_groupwise_median(
         df: pd.DataFrame, col: str, groups_priority: List[str]
 ) -> Tuple[pd.Series, Dict[str, int]]:
-    filled = df[col].copy()
+    filled = df[col]
     report = {"by_subregion": 0, "by_continent": 0, "by_global": 0}
 
-    missing_idx = filled.isna()
-    if not missing_idx.any():
+    n_missing = int(filled.isna().sum())
+    if not n_missing:
         return filled, report
-    
+
     # subregion
     if "subregion" in groups_priority:
-        med_sub = df.groupby("subregion")[col].median(numeric_only=True)
-        idx = missing_idx & df["subregion"].notna() & df["subregion"].isin(med_sub.index)
-        filled.loc[idx] = df.loc[idx, "subregion"].map(med_sub)
-        report["by_subregion"] = int(idx.sum())
-        missing_idx = filled.isna()
+        filled = filled.fillna(df.groupby("subregion", observed=True, sort=False)[col].transform("median"))
+        report["by_subregion"] = n_missing - int(filled.isna().sum())
+        n_missing = int(filled.isna().sum())
 
     # continent
-    if "continent" in groups_priority and missing_idx.any():
-        med_cont = df.groupby("continent")[col].median(numeric_only=True)
-        idx = missing_idx & df["continent"].notna() & df["continent"].isin(med_cont.index)
-        filled.loc[idx] = df.loc[idx, "continent"].map(med_cont)
-        report["by_continent"] = int(idx.sum())
-        missing_idx = filled.isna()
+    if "continent" in groups_priority and n_missing:
+        filled = filled.fillna(df.groupby("continent", observed=True, sort=False)[col].transform("median"))
+        report["by_continent"] = n_missing - int(filled.isna().sum())
+        n_missing = int(filled.isna().sum())
 
     # global
-    if missing_idx.any():
-        global_med = df[col].median(numeric_only=True)
-        filled.loc[missing_idx] = global_med
-        report["by_global"] = int(missing_idx.sum())
+    if n_missing:
+        filled = filled.fillna(df[col].median())
+        report["by_global"] = n_missing - int(filled.isna().sum())
 
     return filled, report
 
 
-# Given duplicated rows, keep the one with more non null values.
-def _choose_row_with_more_non_nulls(rows: pd.DataFrame, important_cols: List[str]) -> pd.Series:
-    counts = rows[important_cols].notna().sum(axis=1)
-    best_idx = counts.idxmax()
-    return rows.loc[best_idx]
-
-
 # ----- Main cleaning -----
 
-def clean_world_data(df_raw: pd.DataFrame, generate_report: bool = True) -> tuple[pd.DataFrame, dict]:
+def clean_world_data(
+        df_raw: pd.DataFrame, generate_report: bool = True, include_stats: bool = False
+) -> tuple[pd.DataFrame, dict]:
     report: Dict[str, any] = {"steps": []}
 
     df = df_raw.copy()
@@ -106,14 +109,14 @@ def clean_world_data(df_raw: pd.DataFrame, generate_report: bool = True) -> tupl
     # Step C: invalid-value filtering
     # Drop: pop <= 0 / area_km2 <= 0 / gdpPercap <= 0
     # NaN: lifeExp out of (0,120)
+    # Compare on float arrays: NaN <= 0 is False, so missing values are kept without a fillna
     before = len(df)
     invalid_mask = (
-        (df["pop"] <= 0) |
-        (df["area_km2"] <= 0) |
-        (df["gdpPercap"] <= 0)
+        (df["pop"].to_numpy(dtype=np.float64, na_value=np.nan) <= 0) |
+        (df["area_km2"].to_numpy(dtype=np.float64, na_value=np.nan) <= 0) |
+        (df["gdpPercap"].to_numpy(dtype=np.float64, na_value=np.nan) <= 0)
     )
-    invalid_mask = invalid_mask.fillna(False)
-    df = df.loc[~invalid_mask].copy()
+    df = df.iloc[~invalid_mask].copy()
     report["dropped_invalid_nonpositive"] = int(before - len(df))
 
     out_of_range = (df["lifeExp"] <= 0) | (df["lifeExp"] >= 120)
@@ -139,25 +142,30 @@ def clean_world_data(df_raw: pd.DataFrame, generate_report: bool = True) -> tupl
     # Step F: deduplicate by iso_a2, keep the one with more non nulls
     before = len(df)
     if df["iso_a2"].duplicated().any():
-        kept_rows = []
-        for _, group in df.groupby("iso_a2", dropna=False):
-            if len(group) == 1:
-                kept_rows.append(group.iloc[0])
-            else:
-                kept_rows.append(_choose_row_with_more_non_nulls(group, important_cols=NUMERIC_COLS))
-        df = pd.DataFrame(kept_rows).reset_index(drop=True)
+        non_null_counts = df[NUMERIC_COLS].notna().sum(axis=1)
+        winners = non_null_counts.groupby(df["iso_a2"], dropna=False).idxmax()
+        df = df.loc[winners.values].reset_index(drop=True)
     report["deduplicated_rows"] = int(before - len(df))
     report["steps"].append("Deduplicated by iso_a2 keeping rows with more non-nulls on key metrics")
 
     # Step G: derive pop_density
     df["pop_density"] = df["pop"] / df["area_km2"]
 
-    # Step H: summary stats report
+    # Low-cardinality grouping columns as categoricals (grouped and filtered on downstream)
+    for col in CATEGORY_COLS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+
+    # Step H: summary stats report (numeric stats only on request; the saved report doesn't use them)
     if generate_report:
-        non_null_ratio = {c: float(df[c].notna().mean()) for c in df.columns}
-        stats = df[["area_km2", "pop", "lifeExp", "gdpPercap", "pop_density"]].describe(include="all").to_dict()
+        non_null_ratio = df.notna().mean().astype(float).to_dict()
         report["non_null_ratio"] = non_null_ratio
-        report["stats"] = stats
+        if include_stats:
+            report["stats"] = (
+                df[["area_km2", "pop", "lifeExp", "gdpPercap", "pop_density"]]
+                .agg(["count", "mean", "std", "min", "max"])
+                .to_dict()
+            )
         report["row_count"] = int(len(df))
 
     return df, report
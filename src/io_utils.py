@@ -10,15 +10,17 @@ This module provides:
         Standardises column names (lowercase, underscores) and removes “Unnamed” columns.
     
     load_raw_world_data(path, ...)
-        Reads a CSV file, cleans whitespace, and returns a DataFrame.
+        Reads the required columns of a CSV file, cleans whitespace, and returns a DataFrame.
 """
 
-import csv
+import codecs
 import re
 from pathlib import Path
 from typing import Dict, Optional
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 
 # --- Constants ---
 REQUIRED_COLUMNS = {
@@ -36,45 +38,61 @@ REQUIRED_COLUMNS = {
 
 COLUMN_ALIASES: Dict[str, str] = {}
 
+# Match 'iso_a2' or 'iso_a2.<number>'
+ISO_A2_PATTERN = re.compile(r"^iso_a2(?:\.\d+)?$")
+
+# pandas' default missing-value markers minus "NA", which is Namibia's ISO code.
+NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NULL", "NaN", "None", "n/a", "nan", "null",
+]
+
 # --- Helper ---
-# Remove BOM and surrounding spaces from a string.
-def _strip_bom_and_space(text: str) -> str:
-    return str(text).lstrip("\ufeff").strip()
+# Remove BOM and surrounding spaces from every value of a Series (or Index)
+# using the vectorised string accessor.
+def _strip_bom_and_space(values: pd.Series | pd.Index) -> pd.Series | pd.Index:
+    return values.astype(str).str.lstrip("\ufeff").str.strip()
+
+# Strip every value of a text column; blanks and missing values become pd.NA.
+def _clean_text_column(s: pd.Series) -> pd.Series:
+    stripped = _strip_bom_and_space(s)
+    return stripped.mask(s.isna() | stripped.isin(["", "nan", "NaN"]), pd.NA)
+
+# Read selected columns with pyarrow's multi-threaded CSV parser.
+# `names` replaces the header row, so duplicated headers can be selected by their de-duplicated names.
+def _read_csv_pyarrow(
+    path: Path, encoding: str, delimiter: str, names: list[str], usecols: list[str]
+) -> pd.DataFrame:
+    table = pa_csv.read_csv(
+        path,
+        read_options=pa_csv.ReadOptions(column_names=names, skip_rows=1, encoding=encoding),
+        parse_options=pa_csv.ParseOptions(delimiter=delimiter),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=usecols, null_values=NA_VALUES, strings_can_be_null=True
+        ),
+    )
+    return table.to_pandas()
 
 # Handles duplicated 'iso_a2' columns that appear in the CSV file.
 def _coalesce_iso_a2(df: pd.DataFrame) -> pd.DataFrame:
-    cols = list(df.columns)
-
-    # Match 'iso_a2' or 'iso_a2.<number>'
-    pattern = re.compile(r"^iso_a2(?:\.\d+)?$")
-    iso_cols = [c for c in cols if pattern.fullmatch(str(c))]
+    iso_cols = [c for c in df.columns if ISO_A2_PATTERN.fullmatch(str(c))]
 
     if not iso_cols:
         return df
 
     # Basic cleanup for single 'iso_a2' column
     if len(iso_cols) == 1:
-        df["iso_a2"] = (
-            df["iso_a2"]
-            .astype(str)
-            .map(_strip_bom_and_space)
-            .replace({"": pd.NA, "nan": pd.NA, "NaN": pd.NA})
-        )
+        df["iso_a2"] = _clean_text_column(df["iso_a2"])
         return df
 
-    # Take the first non-null value per row for multiple 'iso_a2' variants
-    def pick_first_non_null(row):
-        for c in iso_cols:
-            val = row.get(c)
-            if val is None:
-                continue
-            s = _strip_bom_and_space(str(val))
-            if s == "" or s.lower() == "nan":
-                continue
-            return s
-        return pd.NA
+    # Take the first non-null value per row for multiple 'iso_a2' variants:
+    # clean each variant column once, then back-fill across columns.
+    cleaned = []
+    for c in iso_cols:
+        s = _strip_bom_and_space(df[c])
+        cleaned.append(s.mask(df[c].isna() | s.str.lower().isin(["", "nan"]), pd.NA))
 
-    df["iso_a2"] = df.apply(pick_first_non_null, axis=1)
+    df["iso_a2"] = pd.concat(cleaned, axis=1).bfill(axis=1).iloc[:, 0]
 
     # Drop other 'iso_a2' columns except the main one
     to_drop = [c for c in iso_cols if c != "iso_a2"]
@@ -88,27 +106,30 @@ def detect_csv_params(path: str | Path) -> Dict[str, str]:
     path = Path(path)
     encodings_to_try = ["utf-8-sig", "utf-8", "latin-1"]
 
+    # Read the raw bytes once and try each encoding on the buffer in memory
+    with path.open("rb") as f:
+        raw = f.read(65536)
+
     sample = None
     encoding_used = None
     for enc in encodings_to_try:
         try:
-            with path.open("r", encoding=enc, errors="strict") as f:
-                sample = f.read(4096)
-                encoding_used = enc
-                break
-        except Exception:
+            # incremental decoder tolerates a multi-byte character cut at the buffer end
+            sample = codecs.getincrementaldecoder(enc)(errors="strict").decode(raw, final=False)
+            encoding_used = enc
+            break
+        except UnicodeDecodeError:
             continue
 
     if sample is None:
-        with path.open("r", encoding="utf-8", errors="ignore") as f:
-            sample = f.read(4096)
+        sample = raw.decode("utf-8", errors="ignore")
         encoding_used = "utf-8"
 
-    try:
-        dialect = csv.Sniffer().sniff(sample)
-        delimiter = dialect.delimiter
-    except Exception:
-        delimiter = ","
+    # Pick the most frequent candidate delimiter in the header line. The header
+    # is used rather than the whole sample so decimal commas in ';' files don't win.
+    header_line = sample.split("\n", 1)[0]
+    counts = {d: header_line.count(d) for d in (",", ";", "\t", "|")}
+    delimiter = max(counts, key=counts.get) if max(counts.values()) > 0 else ","
 
     return {"encoding": encoding_used, "delimiter": delimiter}
 
@@ -120,7 +141,7 @@ def standardise_columns(df: pd.DataFrame) -> pd.DataFrame:
 
     df = _coalesce_iso_a2(df)
 
-    df.columns = [_strip_bom_and_space(c) for c in df.columns]
+    df.columns = _strip_bom_and_space(df.columns)
 
     return df
 
@@ -138,18 +159,29 @@ def load_raw_world_data(
         encoding = params["encoding"]
         delimiter = params["delimiter"]
 
-    df = pd.read_csv(path, encoding=encoding, sep=delimiter)
+    # Parse only the columns the pipeline uses (plus the iso_a2 variants).
+    # The header alone is read with the C parser, which de-duplicates repeated names.
+    header = pd.read_csv(path, encoding=encoding, sep=delimiter, nrows=0).columns
+    usecols = [
+        c for c, name in zip(header, _strip_bom_and_space(header))
+        if name in REQUIRED_COLUMNS or ISO_A2_PATTERN.fullmatch(name)
+    ]
+
+    # Multi-threaded pyarrow parser; fall back to the C engine for
+    # anything it rejects (e.g. an unsupported delimiter or encoding).
+    try:
+        df = _read_csv_pyarrow(path, encoding, delimiter, list(header), usecols)
+    except (ValueError, pa.ArrowException):
+        df = pd.read_csv(
+            path, encoding=encoding, sep=delimiter, usecols=usecols,
+            keep_default_na=False, na_values=NA_VALUES,
+        )
 
     df = standardise_columns(df)
 
     obj_cols = df.select_dtypes(include=["object"]).columns
     for c in obj_cols:
-        df[c] = (
-            df[c]
-            .astype(str)
-            .map(_strip_bom_and_space)
-            .replace({"": pd.NA, "nan": pd.NA, "NaN": pd.NA})
-        )
+        df[c] = _clean_text_column(df[c])
 
     return df
 
@@ -10,6 +10,8 @@ This script provides:
 
 from pathlib import Path
 import argparse
+import hashlib
+import numpy as np
 import pandas as pd
 from tabulate import tabulate
 from datetime import datetime
@@ -27,6 +29,7 @@ from visualisation import (
     plot_population_density_by_region,
     plot_average_gdp_by_continent,
     plot_gdp_vs_life_expectancy,
+    set_plot_theme,
 )
 
 
@@ -44,7 +47,7 @@ def _parse_args():
     parser.add_argument(
         "--fresh-clean",
         action="store_true",
-        help="Force re-run of cleaning pipeline (otherwise reuse standard process).",
+        help="Force re-run of cleaning pipeline (otherwise reuse the cached cleaned data).",
     )
     return parser.parse_args()
 
@@ -61,18 +64,23 @@ def _slug(s: str | None) -> str:
     )
 
 # --- CLI input helpers and validation ---
-# Return a few sorted unique options for a given column.
-def _list_options(df: pd.DataFrame, col: str, limit: int = 15) -> list[str]:
+# Return the sorted unique values of a column as strings.
+def _column_options(df: pd.DataFrame, col: str) -> list[str]:
     if col not in df.columns:
         return []
-    opts = sorted(df[col].dropna().astype(str).unique())
-    return opts[:limit] + (["..."] if len(opts) > limit else [])
+    return sorted(df[col].dropna().astype(str).unique())
+
+# Return the first few options, with "..." if there are more.
+def _list_options(options: list[str], limit: int = 15) -> list[str]:
+    return options[:limit] + (["..."] if len(options) > limit else [])
 
 #Prompt user for one filter value (press Enter to skip)
 # Case-insensitive; if invalid, show valid examples and retry.
+# Options are computed once per column, not on every retry.
 def _prompt_one_filter(df: pd.DataFrame, col: str, display_name: str) -> str | None:
-    options = sorted(df[col].dropna().astype(str).unique())
+    options = _column_options(df, col)
     options_lower = {o.lower(): o for o in options}
+    sample = _list_options(options)
 
     while True:
         val = input(f"Enter {display_name} (or press Enter for all): ").strip()
@@ -81,32 +89,43 @@ def _prompt_one_filter(df: pd.DataFrame, col: str, display_name: str) -> str | N
         key = val.lower()
         if key in options_lower:
             return options_lower[key]
-        sample = _list_options(df, col)
         print(f"[!] '{val}' is not a valid {display_name}. Available examples: {', '.join(sample)}")
 
 # Apply equality-based filters. None means skip that column.
+# All filters are combined into one boolean mask and applied in a single slice.
 def apply_filters(df: pd.DataFrame, filters: dict[str, str | None]) -> pd.DataFrame:
-    out = df.copy()
+    mask = np.ones(len(df), dtype=bool)
     for col, v in filters.items():
         if v is None:
             continue
-        out = out[out[col].astype(str) == str(v)]
-    return out
+        mask &= (df[col] == v).to_numpy()
+    return df.loc[mask]
+
+# --- Cleaned-data cache ---
+# Key the cache on the raw CSV's modification time and size, plus a hash of the
+# loading/cleaning code so edits to either module invalidate the cached output.
+CLEANING_SOURCES = ("io_utils.py", "cleaning.py")
+
+def _source_key(csv_path: Path) -> str:
+    st = csv_path.stat()
+    code = hashlib.sha256()
+    for name in CLEANING_SOURCES:
+        code.update((Path(__file__).parent / name).read_bytes())
+    return f"{st.st_mtime_ns}-{st.st_size}-{code.hexdigest()[:16]}"
+
+# The cache is usable only if the key matches and every output it stands for exists.
+def _cache_is_valid(meta_path: Path, key: str, outputs: list[Path]) -> bool:
+    if not meta_path.exists() or not all(p.exists() for p in outputs):
+        return False
+    return meta_path.read_text(encoding="utf-8").strip() == key
 
 # Compute basic summary statistics: count, sum, mean, median, min, max, std.
+# describe() covers everything except sum in one pass.
 def compute_summary(df: pd.DataFrame, cols: list[str]) -> pd.DataFrame:
-    agg_map = {
-        "count": "count",
-        "sum": "sum",
-        "mean": "mean",
-        "median": "median",
-        "min": "min",
-        "max": "max",
-        "std": "std",
-    }
-    res = df[cols].agg(agg_map.values())
-    res.index = agg_map.keys()
-    return res.T  # rows = column names, columns = statistic types
+    res = df[cols].describe().T.rename(columns={"50%": "median"})
+    res["sum"] = df[cols].sum()
+    # rows = column names, columns = statistic types
+    return res[["count", "sum", "mean", "median", "min", "max", "std"]]
 
 
 
@@ -118,20 +137,34 @@ def main(args=None):
     out_dir = root / "outputs"
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    # Load raw data
-    df_raw = load_raw_world_data(csv_path)
+    clean_csv = out_dir / "worldData_clean.csv"
+    report_txt = out_dir / "cleaning_report.txt"
+    clean_parquet = out_dir / "worldData_clean.parquet"
+    cache_meta = out_dir / "worldData_clean.parquet.meta"
+    key = _source_key(csv_path)
+    fresh_clean = bool(args and getattr(args, "fresh_clean", False))
+
+    if not fresh_clean and _cache_is_valid(cache_meta, key, [clean_parquet, clean_csv, report_txt]):
+        # Raw CSV unchanged since the last run: reuse the cached cleaned data
+        df_clean = pd.read_parquet(clean_parquet)
+        print(f"[OK] Reused cached cleaned data -> {clean_parquet}")
+    else:
+        # Load raw data
+        df_raw = load_raw_world_data(csv_path)
 
-    # Clean dataset 
-    df_clean, report = clean_world_data(df_raw, generate_report=True)
+        # Clean dataset
+        df_clean, report = clean_world_data(df_raw, generate_report=True)
 
-    # Export cleaned CSV and report
-    clean_csv = out_dir / "worldData_clean.csv"
-    df_clean.to_csv(clean_csv, index=False, encoding="utf-8")
-    print(f"[OK] Saved cleaned CSV -> {clean_csv}")
+        # Export cleaned CSV and report
+        df_clean.to_csv(clean_csv, index=False, encoding="utf-8")
+        print(f"[OK] Saved cleaned CSV -> {clean_csv}")
 
-    report_txt = out_dir / "cleaning_report.txt"
-    save_cleaning_report(report, report_txt)
-    print(f"[OK] Saved cleaning report -> {report_txt}")
+        save_cleaning_report(report, report_txt)
+        print(f"[OK] Saved cleaning report -> {report_txt}")
+
+        # Cache the cleaned frame for the next run
+        df_clean.to_parquet(clean_parquet, index=False)
+        cache_meta.write_text(key, encoding="utf-8")
 
     # Analysis 
     continent, continent_count = most_countries_by_continent(df_clean)
@@ -158,13 +191,18 @@ def main(args=None):
     print(f"[OK] Wrote analysis summary -> {summary_path}")
 
     # --- Bonus Visualisations ---
-    plot_average_gdp_by_continent(df_clean, out_dir / "avg_gdp_by_continent.png")
-    plot_gdp_vs_life_expectancy(df_clean, out_dir / "gdp_vs_lifeExp.png")
-    plot_population_density_by_region(df_clean, out_dir / "population_density_by_region.png")
+    # Aggregate once here; the plotting functions only render these small tables.
+    gdp_by_continent = df_clean.groupby("continent", observed=True, sort=False)["gdpPercap"].mean()
+    gdp_life_by_subregion = df_clean.groupby("subregion", observed=True)[["gdpPercap", "lifeExp"]].mean()
+    density_by_region = df_clean.groupby("region_un", dropna=False, observed=True, sort=False)["pop_density"].mean()
+
+    set_plot_theme()
+    plot_average_gdp_by_continent(gdp_by_continent, out_dir / "avg_gdp_by_continent.png")
+    plot_gdp_vs_life_expectancy(gdp_life_by_subregion, out_dir / "gdp_vs_lifeExp.png")
+    plot_population_density_by_region(density_by_region, out_dir / "population_density_by_region.png")
 
     # --- Interactive filtering (CLI) ---
     # User can filter by continent, region, subregion, or type.
-    df_clean = pd.read_csv(clean_csv, encoding="utf-8")  # Reload cleaned data to avoid recomputation
 
     print("\n=== Interactive Filter ===")
     print("You can filter by any of the following (press Enter to skip each):")
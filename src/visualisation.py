@@ -4,105 +4,121 @@ Generates analytical charts to visualise global socio-economic patterns.
 
 This script provides:
       
-    plot_population_density_by_region(df, path):
+    plot_population_density_by_region(density_by_region, path):
     Generates a bar chart illustrating the average population density per UN region.
 
-    plot_average_gdp_by_continent(df, path):
+    plot_average_gdp_by_continent(gdp_by_continent, path):
     Creates a bar chart showing the average GDP per capita for each continent.
 
-    plot_gdp_vs_life_expectancy(df, path):
+    plot_gdp_vs_life_expectancy(df_summary, path):
     Plots a scatter chart comparing average life expectancy and GDP per capita by subregion.
+
+    set_plot_theme():
+    Applies the shared Seaborn whitegrid theme; call once before rendering.
+
+The functions take pre-aggregated data (computed once in main.py) and only render it.
+Each chart is drawn on its own matplotlib Figure (no pyplot state), which is
+released as soon as it is saved.
        
 """
 
 from pathlib import Path
 import pandas as pd
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import seaborn as sns 
 
-# Plot and save average population density by region.
-def plot_population_density_by_region(df: pd.DataFrame, output_path: str | Path) -> None:
-    required = {"region_un", "pop", "area_km2"}
-    if not required.issubset(df.columns):
-        raise ValueError(f"Missing required columns: {required - set(df.columns)}")
-    df = df.copy()
-    df["pop_density"] = df["pop"] / df["area_km2"]
-    df = df[df["pop_density"].notna() & (df["pop_density"] > 0)]
-
-    grouped = df.groupby("region_un", dropna=False)["pop_density"].mean().sort_values(ascending=False)
-    
-    plt.figure(figsize=(10,6))
-    grouped.plot(kind="bar", edgecolor="black", color="skyblue")
-    plt.title("Average Population Density by Region (people per km²)", fontsize=13)
-    plt.xlabel("Region (UN classification)")
-    plt.ylabel("Average Population Density")
-    plt.xticks(rotation=45, ha="right")
-    plt.grid(axis="y", linestyle="--", alpha=0.6)
-    plt.tight_layout()
+# Apply the shared chart theme. It changes global rcParams, so call it once
+# before rendering rather than from inside every plot function.
+def set_plot_theme() -> None:
+    sns.set_theme(style="whitegrid")
 
+# Save a figure, creating the output directory if needed.
+def _save_figure(fig: Figure, output_path: str | Path) -> Path:
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(output_path, dpi=300)
-    plt.close()
-    print(f"[OK] Saved population density chart -> {output_path}")    
-
+    fig.savefig(output_path, dpi=300)
+    return output_path
 
-# Plot and save a bar chart of average GDP per capita by continent.
-def plot_average_gdp_by_continent(df: pd.DataFrame, output_path: str | Path) -> None:
-    required = {"continent", "gdpPercap"}
-    missing = required - set(df.columns)
-    if missing:
-        raise ValueError(f"Missing required columns: {missing}")
+# Raise ValueError unless the pre-aggregated values are non-empty and numeric.
+def _require_numeric(values: pd.Series, name: str) -> None:
+    if values.empty:
+        raise ValueError(f"No data to plot for {name}")
+    if not pd.api.types.is_numeric_dtype(values):
+        raise ValueError(f"{name} must be numeric, got {values.dtype}")
 
-    # count the mean of each continent
-    grouped = (
-        df.dropna(subset=["continent", "gdpPercap"])
-          .groupby("continent")["gdpPercap"]
-          .mean(numeric_only=True)
-          .sort_values(ascending=False)
-    )
+# Plot and save average population density by region.
+# density_by_region: mean pop_density indexed by region_un.
+def plot_population_density_by_region(density_by_region: pd.Series, output_path: str | Path) -> None:
+    _require_numeric(density_by_region, "pop_density")
+    grouped = density_by_region.dropna().sort_values(ascending=False)
+    
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+    grouped.plot(kind="bar", ax=ax, edgecolor="black", color="skyblue")
+    ax.set_title("Average Population Density by Region (people per km²)", fontsize=13)
+    ax.set_xlabel("Region (UN classification)")
+    ax.set_ylabel("Average Population Density")
+    ax.tick_params(axis="x", labelrotation=45)
+    for label in ax.get_xticklabels():
+        label.set_horizontalalignment("right")
+    ax.grid(axis="y", linestyle="--", alpha=0.6)
+    fig.tight_layout()
+
+    output_path = _save_figure(fig, output_path)
+    print(f"[OK] Saved population density chart -> {output_path}")    
 
-    plt.figure(figsize=(10, 6))
-    grouped.plot(kind="bar", edgecolor="black", color="skyblue")
-    plt.title("Average GDP per Capita by Continent", fontsize=13, pad=8)
-    plt.xlabel("Continent")
-    plt.ylabel("Average GDP per Capita")
-    plt.xticks(rotation=45, ha="right")
-    plt.grid(axis="y", linestyle="--", alpha=0.6)
-    plt.tight_layout()
 
-    output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(output_path, dpi=300)
-    plt.close()
+# Plot and save a bar chart of average GDP per capita by continent.
+# gdp_by_continent: mean gdpPercap indexed by continent.
+def plot_average_gdp_by_continent(gdp_by_continent: pd.Series, output_path: str | Path) -> None:
+    _require_numeric(gdp_by_continent, "gdpPercap")
+    grouped = gdp_by_continent.dropna().sort_values(ascending=False)
+
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+    grouped.plot(kind="bar", ax=ax, edgecolor="black", color="skyblue")
+    ax.set_title("Average GDP per Capita by Continent", fontsize=13, pad=8)
+    ax.set_xlabel("Continent")
+    ax.set_ylabel("Average GDP per Capita")
+    ax.tick_params(axis="x", labelrotation=45)
+    for label in ax.get_xticklabels():
+        label.set_horizontalalignment("right")
+    ax.grid(axis="y", linestyle="--", alpha=0.6)
+    fig.tight_layout()
+
+    output_path = _save_figure(fig, output_path)
     print(f"[OK] Saved chart -> {output_path}")
 
 
 # Plot average GDP per capita vs life expectancy by subregion.
-def plot_gdp_vs_life_expectancy(df: pd.DataFrame, output_path: str | Path) -> None:
-    required = {"subregion", "gdpPercap", "lifeExp"}
-    missing = required - set(df.columns)
+# df_summary: mean gdpPercap and lifeExp indexed by subregion.
+def plot_gdp_vs_life_expectancy(df_summary: pd.DataFrame, output_path: str | Path) -> None:
+    required = {"gdpPercap", "lifeExp"}
+    missing = required - set(df_summary.columns)
     if missing:
         raise ValueError(f"Missing required columns: {missing}")
+    for col in sorted(required):
+        _require_numeric(df_summary[col], col)
 
-    # Summarise the average of gdpPercap and lifeExp of each subregion
     df_summary = (
-        df.dropna(subset=["subregion", "gdpPercap", "lifeExp"])
-          .groupby("subregion", as_index=False)[["gdpPercap", "lifeExp"]]
-          .mean()
+        df_summary.dropna(subset=["gdpPercap", "lifeExp"])
+          .rename_axis("subregion")
+          .reset_index()
     )
 
     n_sub = len(df_summary)
     palette = sns.color_palette("tab20", n_sub)
     colour_map = {sr: palette[i % len(palette)] for i, sr in enumerate(df_summary["subregion"])}
 
-    sns.set_theme(style="whitegrid")
-    plt.figure(figsize=(10.5, 6.5))
-    ax = sns.scatterplot(
+    fig = Figure(figsize=(10.5, 6.5))
+    ax = fig.subplots()
+    sns.scatterplot(
         data=df_summary,
+        ax=ax,
         x="gdpPercap",
         y="lifeExp",
         hue="subregion",
+        hue_order=list(colour_map),
         palette=colour_map,
         s=120,
         edgecolor="black",
@@ -119,9 +135,6 @@ def plot_gdp_vs_life_expectancy(df: pd.DataFrame, output_path: str | Path) -> No
     ax.legend(title="Subregion", loc="upper left", bbox_to_anchor=(1.02, 1),
               frameon=True, ncol=ncol, borderaxespad=0.0)
 
-    plt.tight_layout()
-    output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(output_path, dpi=300)
-    plt.close()
+    fig.tight_layout()
+    output_path = _save_figure(fig, output_path)
     print(f"[OK] Saved subregion-level GDP vs Life Expectancy chart -> {output_path}")
\ No newline at end of file
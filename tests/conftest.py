@@ -5,6 +5,7 @@ Shared pytest configuration and reusable fixtures.
 """
 from pathlib import Path
 import sys
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -14,28 +15,37 @@ SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
-# Small, tidy dataset for testing analysis functions (deterministic answers).
-@pytest.fixture
-def sample_df() -> pd.DataFrame:
-    rows = [
-        # iso_a2, name_long, continent, region_un, subregion, type, area_km2, pop, lifeExp, gdpPercap
-        ("AA", "Alfa",   "Europe", "Europe", "Western Europe", "Country", 1000, 1_000_000, 80.0, 50_000),
-        ("BB", "Bravo",  "Asia",   "Asia",   "Eastern Asia",   "Country", 2000, 2_000_000, 76.0, 30_000),
-        ("CC", "Charlie","Africa", "Africa", "Eastern Africa", "Country", 3000, 3_000_000, 60.0,  2_000),
-        ("DD", "Delta",  "Africa", "Africa", "Western Africa", "Country", 4000,   500_000, 62.0,  1_800),
-    ]
-    return pd.DataFrame(rows, columns=[
-        "iso_a2","name_long","continent","region_un","subregion","type",
-        "area_km2","pop","lifeExp","gdpPercap"
-    ])
+from cleaning import clean_world_data
 
+# Small, tidy dataset for testing analysis functions (deterministic answers).
+# Session-scoped: the analysis functions only read it.
+# Built column-wise with explicit dtypes, so no per-row type inference is needed.
+# Parametrised over the grouping columns' dtype: "categorical" as clean_world_data
+# returns them, "object" to exercise the analysis functions' own categorisation.
+@pytest.fixture(scope="session", params=["categorical", "object"])
+def sample_df(request: pytest.FixtureRequest) -> pd.DataFrame:
+    df = pd.DataFrame({
+        "iso_a2":    np.array(["AA", "BB", "CC", "DD"], dtype=object),
+        "name_long": np.array(["Alfa", "Bravo", "Charlie", "Delta"], dtype=object),
+        "continent": pd.Categorical(["Europe", "Asia", "Africa", "Africa"]),
+        "region_un": pd.Categorical(["Europe", "Asia", "Africa", "Africa"]),
+        "subregion": pd.Categorical(["Western Europe", "Eastern Asia", "Eastern Africa", "Western Africa"]),
+        "type":      pd.Categorical(["Country"] * 4),
+        "area_km2":  np.array([1000, 2000, 3000, 4000], dtype="float64"),
+        "pop":       np.array([1_000_000, 2_000_000, 3_000_000, 500_000], dtype="int64"),
+        "lifeExp":   np.array([80.0, 76.0, 60.0, 62.0], dtype="float64"),
+        "gdpPercap": np.array([50_000, 30_000, 2_000, 1_800], dtype="float64"),
+    })
+    if request.param == "object":
+        df = df.astype({c: object for c in ("continent", "region_un", "subregion", "type")})
+    return df
 
 #Messy input to exercise the cleaning pipeline:
 # - duplicate iso_a2
 # - invalid nonpositive values
 # - extreme lifeExp
 # - some NaNs 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def raw_df_for_cleaning() -> pd.DataFrame:
     rows = [
         # duplicate AA (second row has better completeness to test "keep more non-nulls")
@@ -52,3 +62,11 @@ def raw_df_for_cleaning() -> pd.DataFrame:
         "iso_a2","name_long","continent","region_un","subregion","type",
         "area_km2","pop","lifeExp","gdpPercap"
     ])
+
+
+# Cleaned frame shared by the invariant checks, so the pipeline runs once per session.
+# The report is skipped here; its contents are tested separately.
+@pytest.fixture(scope="session")
+def cleaned_df(raw_df_for_cleaning: pd.DataFrame) -> pd.DataFrame:
+    df_clean, _ = clean_world_data(raw_df_for_cleaning, generate_report=False)
+    return df_clean
@@ -17,6 +17,11 @@ def test_most_countries_by_continent(sample_df: pd.DataFrame):
     assert cont == "Africa"
     assert n == 2
 
+# On a tie the continent that appears first in the data wins.
+def test_most_countries_by_continent_tie():
+    df = pd.DataFrame({"continent": ["Europe", "Asia", "Asia", "Europe"]})
+    assert most_countries_by_continent(df) == ("Europe", 2)
+
 # The function should return Africa as the region with the largest combined area (3000 + 4000 = 7000 km²).
 def test_region_with_largest_area(sample_df: pd.DataFrame):
     region, total_area = region_with_largest_area(sample_df)
@@ -34,3 +39,9 @@ def test_subregion_gdp_extremes(sample_df: pd.DataFrame):
     sub_min, gdp_min, sub_max, gdp_max = subregion_gdp_extremes(sample_df)
     assert sub_min == "Western Africa" and abs(gdp_min - 1800) < 1e-9
     assert sub_max == "Western Europe" and abs(gdp_max - 50000) < 1e-9
+
+# On a tie the alphabetically first subregion wins.
+def test_subregion_gdp_extremes_tie():
+    df = pd.DataFrame({"subregion": ["Z", "A", "M"], "gdpPercap": [1.0, 1.0, 5.0]})
+    sub_min, gdp_min, sub_max, gdp_max = subregion_gdp_extremes(df)
+    assert (sub_min, gdp_min, sub_max, gdp_max) == ("A", 1.0, "M", 5.0)
@@ -8,36 +8,89 @@ These tests verify that the cleaning function:
     Removes duplicates, invalids, and missing identifiers
     Enforces numeric validity and life expectancy bounds
     Correctly computes population density
+    Parses messy numeric strings like pd.to_numeric
 """
-import math
+import numpy as np
 import pandas as pd
-from cleaning import clean_world_data
+import pytest
+from cleaning import clean_world_data, _to_numeric_safe
 
-REQUIRED = {
+REQUIRED = frozenset({
     "iso_a2","name_long","continent","region_un","subregion","type",
     "area_km2","pop","lifeExp","gdpPercap","pop_density"
-}
+})
 
-def test_clean_world_data_core_invariants(raw_df_for_cleaning: pd.DataFrame):
-    df_clean, report = clean_world_data(raw_df_for_cleaning, generate_report=True)
+def test_clean_world_data_core_invariants(cleaned_df: pd.DataFrame):
+    df_clean = cleaned_df
 
     # basic shape and columns
     assert isinstance(df_clean, pd.DataFrame)
-    assert REQUIRED.issubset(df_clean.columns)
-    assert isinstance(report, dict)
+    assert not (REQUIRED - set(df_clean.columns))
+
+    # grouping columns are categorical
+    for col in ("continent", "region_un", "subregion", "type"):
+        assert isinstance(df_clean[col].dtype, pd.CategoricalDtype)
 
     # no duplicate iso_a2
     assert df_clean["iso_a2"].isna().sum() == 0
-    assert df_clean.groupby("iso_a2").size().max() == 1
+    assert df_clean["iso_a2"].is_unique
 
-    # numeric positivity
-    assert (df_clean["area_km2"] > 0).all()
-    assert (df_clean["pop"] > 0).all()
-    assert (df_clean["gdpPercap"] > 0).all()
+    # bind each numeric column's array once
+    cols = {c: df_clean[c].to_numpy() for c in ("area_km2", "pop", "gdpPercap", "lifeExp", "pop_density")}
+
+    # numeric positivity in one reduction (NaN makes min() NaN, which also fails)
+    positive = np.column_stack([cols["area_km2"], cols["pop"], cols["gdpPercap"]])
+    assert positive.min() > 0
 
     # reasonable life expectancy
-    assert ((df_clean["lifeExp"] > 0) & (df_clean["lifeExp"] < 120)).all()
+    assert cols["lifeExp"].min() > 0 and cols["lifeExp"].max() < 120
 
     # derived density correct (within floating tolerance)
-    dens = (df_clean["pop"] / df_clean["area_km2"]).fillna(math.nan)
-    assert (abs(df_clean["pop_density"] - dens) < 1e-9).all()
+    dens = cols["pop"] / cols["area_km2"]
+    np.testing.assert_allclose(cols["pop_density"], dens, rtol=0, atol=1e-9)
+
+# The report records what each step dropped or filled for the messy fixture.
+def test_clean_world_data_report(raw_df_for_cleaning: pd.DataFrame):
+    df_clean, report = clean_world_data(raw_df_for_cleaning, generate_report=True)
+
+    assert isinstance(report, dict)
+    assert report["row_count"] == len(df_clean) == 2
+    assert report["dropped_missing_identifiers"] == 2
+    assert report["dropped_invalid_nonpositive"] == 2
+    assert report["lifeExp_out_of_range_set_nan"] == 1
+    assert report["deduplicated_rows"] == 1
+    assert report["impute_lifeExp"] == {"by_subregion": 1, "by_continent": 0, "by_global": 1}
+    assert set(report["non_null_ratio"]) == set(df_clean.columns)
+    assert "stats" not in report
+
+# Messy numeric strings parse (or become NaN) the same way pd.to_numeric did.
+@pytest.mark.parametrize("raw, expected", [
+    ("1,234", 1234.0),          # thousands separator
+    ("\u00a05\u00a0", 5.0),      # non-breaking spaces
+    (" 42 ", 42.0),
+    ("5 678", np.nan),          # inner spaces are not a number
+    ("nan", np.nan),
+    ("", np.nan),
+    (None, np.nan),
+    ("abc", np.nan),
+    ("-12.5", -12.5),
+    ("+.5", 0.5),
+    ("1.5e3", 1500.0),
+    ("2E-2", 0.02),
+    ("inf", np.inf),
+    ("-Infinity", -np.inf),
+])
+def test_to_numeric_safe(raw, expected):
+    result = _to_numeric_safe(pd.Series([raw], dtype=object))
+    np.testing.assert_equal(result.iloc[0], expected)
+
+# Whole-number text stays integer, as with pd.to_numeric; any decimal or gap gives float64.
+@pytest.mark.parametrize("raw, dtype", [
+    (["1,234", "5"], "int64"),
+    (["+7", "-3"], "int64"),
+    (["1,234", "5.0"], "float64"),
+    (["1,234", ""], "float64"),
+    (["1e3", "2"], "float64"),
+])
+def test_to_numeric_safe_dtype(raw, dtype):
+    assert _to_numeric_safe(pd.Series(raw, dtype=object)).dtype == dtype
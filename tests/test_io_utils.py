@@ -0,0 +1,58 @@
+"""
+tests/test_io_utils.py
+Unit tests for CSV loading
+
+These tests verify that load_raw_world_data:
+    Handles a BOM and duplicated iso_a2 headers
+    Keeps Namibia's "NA" code while treating "#N/A" cells as missing
+    Returns the same frame from the pyarrow parser and the C-engine fallback
+"""
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+import io_utils
+from io_utils import load_raw_world_data
+
+CSV_TEXT = (
+    "iso_a2,name_long,continent,region_un,subregion,type,area_km2,pop,lifeExp,gdpPercap,iso_a2,notes\n"
+    "NA,Namibia,Africa,Africa,Southern Africa,Sovereign country,824000,2400000,63.0,9500,NA,x\n"
+    ",France,Europe,Europe,Western Europe,Country,550000,67000000,82.5,41000,FR,x\n"
+    " DE ,Germany,Europe,Europe,Western Europe,Country,357000,83000000,#N/A,48000,,x\n"
+    "#N/A,Nowhere,#N/A,Oceania,Polynesia,Country,10,#N/A,70.0,1000,#N/A,x\n"
+)
+
+@pytest.fixture
+def messy_csv(tmp_path: Path) -> Path:
+    path = tmp_path / "world.csv"
+    path.write_bytes(b"\xef\xbb\xbf" + CSV_TEXT.encode("utf-8"))
+    return path
+
+def test_load_raw_world_data_messy_csv(messy_csv: Path):
+    df = load_raw_world_data(messy_csv)
+
+    # only the required columns survive, with one coalesced iso_a2
+    assert sorted(df.columns) == sorted(io_utils.REQUIRED_COLUMNS)
+
+    assert df["iso_a2"].tolist()[:3] == ["NA", "FR", "DE"]
+    assert pd.isna(df.loc[3, "iso_a2"])
+    assert df["name_long"].tolist() == ["Namibia", "France", "Germany", "Nowhere"]
+
+    # "#N/A" is missing in text and numeric columns alike
+    assert pd.isna(df.loc[3, "continent"])
+    assert pd.isna(df.loc[2, "lifeExp"])
+    assert pd.isna(df.loc[3, "pop"])
+    assert df.loc[1, "lifeExp"] == 82.5
+
+# Forcing the C-engine fallback must not change the loaded frame.
+def test_load_raw_world_data_fallback_matches(messy_csv: Path, monkeypatch: pytest.MonkeyPatch):
+    fast = load_raw_world_data(messy_csv)
+
+    def _reject(*args, **kwargs):
+        raise ValueError("forced fallback")
+
+    monkeypatch.setattr(io_utils, "_read_csv_pyarrow", _reject)
+    fallback = load_raw_world_data(messy_csv)
+
+    pd.testing.assert_frame_equal(fast, fallback)